@@ -230,12 +230,17 @@ class DataProcessor:
             }
         
         total_employees = len(processed_employees)
-        total_hours_worked = sum(emp['totals']['total_hours_worked'] for emp in processed_employees.values())
-        total_regular_hours = sum(emp['totals']['total_regular_hours'] for emp in processed_employees.values())
-        total_extra_hours_50 = sum(emp['totals']['total_extra_hours_50'] for emp in processed_employees.values())
-        total_extra_hours_100 = sum(emp['totals']['total_extra_hours_100'] for emp in processed_employees.values())
-        total_night_hours = sum(emp['totals']['total_night_hours'] for emp in processed_employees.values())
-        total_pending_hours = sum(emp['compensations']['remaining_pending_hours'] for emp in processed_employees.values())
+        total_hours_worked = total_regular_hours = total_extra_hours_50 = 0
+        total_extra_hours_100 = total_night_hours = total_pending_hours = 0
+        # Una sola pasada sobre los empleados en lugar de una suma por métrica
+        for emp in processed_employees.values():
+            totals = emp['totals']
+            total_hours_worked += totals['total_hours_worked']
+            total_regular_hours += totals['total_regular_hours']
+            total_extra_hours_50 += totals['total_extra_hours_50']
+            total_extra_hours_100 += totals['total_extra_hours_100']
+            total_night_hours += totals['total_night_hours']
+            total_pending_hours += emp['compensations']['remaining_pending_hours']
         
         return {
             'total_employees': total_employees,
@@ -4,247 +4,353 @@ Generador de archivos Excel usando pandas
 
 import os
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterator, Tuple
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 from config.default_config import DEFAULT_CONFIG
 
+# openpyxl usa el serializador incremental de lxml (xmlfile) en modo write-only;
+# sin lxml (o con OPENPYXL_LXML=False) cae a un shim de ElementTree bastante más lento.
+# LXML es el mismo flag con el que openpyxl decide qué serializador usar.
+from openpyxl.xml import LXML
+
+# Nombre del estilo registrado para las filas de encabezados
+HEADER_STYLE = 'report_header'
+
+# Letras de columna precalculadas, indexadas desde 1 (COL_LETTERS[1] == 'A')
+COL_LETTERS = (None,) + tuple(get_column_letter(i) for i in range(1, 64))
+
+# Columnas de horas del resumen (se redondean y se totalizan)
+SUMMARY_HOURS_COLUMNS = (
+    'Total Horas', 'Horas Regulares', 'Horas Extra 50%', 'Horas Extra 100%',
+    'Horas Nocturnas', 'Horas Feriado',
+)
+# Claves de emp['totals'] de cada columna de SUMMARY_HOURS_COLUMNS
+SUMMARY_TOTALS_KEYS = (
+    'total_hours_worked', 'total_regular_hours', 'total_extra_hours_50', 'total_extra_hours_100',
+    'total_night_hours', 'total_holiday_hours',
+)
+
+# Orden de los turnos en el resumen (los demás/vacíos van al final)
+TURNO_ORDER = ('Mañana', 'Tarde', 'Noche')
+
+# Valores de las columnas Sí/No
+SI = 'Sí'
+NO = 'No'
+
+# Días que se marcan como "Fin de semana" en las observaciones
+WEEKEND_DAYS = frozenset(('Sábado', 'Domingo'))
+
+# Columnas de la hoja "Detalle Diario" (orden de _iter_daily_rows)
+DAILY_COLUMNS = (
+    'ID Empleado', 'Nombre', 'Apellido', 'Fecha', 'Día', 'Turno', 'Inicio Turno', 'Fin Turno',
+    'Es Franco', 'Horas Trabajadas', 'Horas Regulares', 'Horas Extra 50%', 'Horas Extra 100%',
+    'Horas Nocturnas', 'Horas Feriado', 'Horas Pendientes', 'Es Feriado', 'Nombre Feriado',
+    'Tiene Licencia', 'Tipo Licencia', 'Tiene Ausencia', 'Observaciones', 'Cálculo (explicación)',
+)
+
 
 class ExcelReportGenerator:
+    # Estilos (inmutables): se crean una sola vez por proceso y los comparten
+    # todas las instancias. Colores en ARGB de 8 dígitos.
+    title_font = Font(bold=True, size=12)
+    bold_font = Font(bold=True)
+    header_font = Font(bold=True, color="FFFFFFFF")
+    header_fill = PatternFill(start_color="FF366092", end_color="FF366092", fill_type="solid")
+    regular_fill = PatternFill(start_color="FFD4EDDA", end_color="FFD4EDDA", fill_type="solid")
+    extra_50_fill = PatternFill(start_color="FFFFF3CD", end_color="FFFFF3CD", fill_type="solid")
+    extra_100_fill = PatternFill(start_color="FFF8D7DA", end_color="FFF8D7DA", fill_type="solid")
+    night_fill = PatternFill(start_color="FFD1ECF1", end_color="FFD1ECF1", fill_type="solid")
+    holiday_fill = PatternFill(start_color="FFD6EAF8", end_color="FFD6EAF8", fill_type="solid")
+    pending_fill = PatternFill(start_color="FFF5C6CB", end_color="FFF5C6CB", fill_type="solid")
+
+    # Colores por turno
+    turno_manana_fill = PatternFill(start_color="FFFFF9E6", end_color="FFFFF9E6", fill_type="solid")  # Amarillo suave
+    turno_tarde_fill = PatternFill(start_color="FFFFE6F0", end_color="FFFFE6F0", fill_type="solid")   # Rosa suave
+    turno_noche_fill = PatternFill(start_color="FFE6E6FA", end_color="FFE6E6FA", fill_type="solid")   # Lavanda suave
+
+    thin_border = Border(
+        left=Side(style='thin'), right=Side(style='thin'),
+        top=Side(style='thin'), bottom=Side(style='thin')
+    )
+    center_alignment = Alignment(horizontal='center', vertical='center')
+    wrap_alignment = Alignment(wrap_text=True, vertical='top')
+
+    # Estilos con nombre de las celdas de datos (borde fino + relleno): nombre -> relleno.
+    # Asignar `cell.style = nombre` es una sola operación por celda en lugar de fill + border.
+    data_styles = {
+        'data': None,
+        'turno_manana': turno_manana_fill,
+        'turno_tarde': turno_tarde_fill,
+        'turno_noche': turno_noche_fill,
+        'regular': regular_fill,
+        'extra_50': extra_50_fill,
+        'extra_100': extra_100_fill,
+        'night': night_fill,
+        'holiday': holiday_fill,
+        'pending': pending_fill,
+    }
+
     def __init__(self):
         self.output_dir = os.path.expanduser(DEFAULT_CONFIG['output_directory'])
         self.filename_format = DEFAULT_CONFIG['filename_format']
 
-        # Estilos
-        self.header_font = Font(bold=True, color="FFFFFF")
-        self.header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        self.regular_fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-        self.extra_50_fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
-        self.extra_100_fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-        self.night_fill = PatternFill(start_color="D1ECF1", end_color="D1ECF1", fill_type="solid")
-        self.holiday_fill = PatternFill(start_color="D6EAF8", end_color="D6EAF8", fill_type="solid")
-        self.pending_fill = PatternFill(start_color="F5C6CB", end_color="F5C6CB", fill_type="solid")
-        
-        # Colores por turno
-        self.turno_manana_fill = PatternFill(start_color="FFF9E6", end_color="FFF9E6", fill_type="solid")  # Amarillo suave
-        self.turno_tarde_fill = PatternFill(start_color="FFE6F0", end_color="FFE6F0", fill_type="solid")   # Rosa suave
-        self.turno_noche_fill = PatternFill(start_color="E6E6FA", end_color="E6E6FA", fill_type="solid")   # Lavanda suave
-
-        self.thin_border = Border(
-            left=Side(style='thin'), right=Side(style='thin'),
-            top=Side(style='thin'), bottom=Side(style='thin')
-        )
-        self.center_alignment = Alignment(horizontal='center', vertical='center')
-
     # -------- público --------
 
     def generate_report(self, processed_data: Dict, start_date: str, end_date: str, output_filename: str = None) -> str:
-        """Genera el reporte Excel completo usando pandas."""
+        """Genera el reporte Excel completo en una sola pasada (openpyxl write-only)."""
         if not output_filename:
             output_filename = self.filename_format.format(
                 start_date=start_date.replace('-', ''), 
                 end_date=end_date.replace('-', '')
             )
         
+        if not LXML:
+            print("⚠️ lxml no está instalado: la escritura del Excel será más lenta (pip install lxml)")
+
         os.makedirs(self.output_dir, exist_ok=True)
         filepath = os.path.join(self.output_dir, output_filename)
 
-        # Crear DataFrames
+        # DataFrame del resumen (se ordena por turno); el detalle diario se
+        # genera fila a fila mientras se escribe, sin una segunda copia en memoria
         df_summary = self._create_summary_dataframe(processed_data)
-        df_daily = self._create_daily_dataframe(processed_data)
-
-        # Escribir a Excel con pandas
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df_summary.to_excel(writer, sheet_name='Resumen Consolidado', index=False, startrow=4)
-            df_daily.to_excel(writer, sheet_name='Detalle Diario', index=False, startrow=4)
 
-        # Aplicar estilos con openpyxl
-        self._apply_styles(filepath, start_date, end_date, df_summary, df_daily)
+        # Escribir filas ya estilizadas en modo write-only: sin recargar el archivo
+        # para aplicar estilos y sin mantener todas las celdas en memoria
+        generated_at = datetime.now().strftime('%d/%m/%Y %H:%M')  # mismo instante en todas las hojas
+        wb = Workbook(write_only=True)
+        self._register_named_styles(wb)
+        self._write_summary_sheet(wb.create_sheet('Resumen Consolidado'), start_date, end_date,
+                                  generated_at, df_summary)
+        self._write_daily_sheet(wb.create_sheet('Detalle Diario'), start_date, end_date,
+                                generated_at, processed_data)
+        self._save_workbook(wb, filepath)
         
         print(f"✅ Reporte Excel generado: {filepath}")
         return filepath
 
-    # -------- DataFrames --------
+    def _register_named_styles(self, wb: Workbook):
+        """Registra en el workbook los estilos con nombre que usan las hojas."""
+        wb.add_named_style(NamedStyle(
+            name=HEADER_STYLE, font=self.header_font, fill=self.header_fill,
+            border=self.thin_border, alignment=self.center_alignment
+        ))
+        for name, fill in self.data_styles.items():
+            style = NamedStyle(name=name, font=DEFAULT_FONT, border=self.thin_border)
+            if fill:
+                style.fill = fill
+            wb.add_named_style(style)
+
+    def _save_workbook(self, wb: Workbook, filepath: str):
+        """Guarda el workbook a través de un buffer grande (menos syscalls de escritura)."""
+        with open(filepath, 'wb', buffering=1 << 20) as fh:
+            wb.save(fh)
+
+    # -------- Datos --------
 
     def _create_summary_dataframe(self, processed_data: Dict) -> pd.DataFrame:
         """Crea DataFrame del resumen consolidado."""
-        rows = []
+        # Una lista por columna, armadas en una sola pasada
+        columns = {name: [] for name in ('ID Empleado', 'Nombre', 'Apellido', 'Turno') + SUMMARY_HOURS_COLUMNS}
+        ids, first_names, last_names, turnos, *hours = columns.values()
         for emp in processed_data.values():
             info = emp['employee_info']
             totals = emp['totals']
-            rows.append({
-                'ID Empleado': info.get('employeeInternalId', ''),
-                'Nombre': info.get('firstName', ''),
-                'Apellido': info.get('lastName', ''),
-                'Turno': info.get('turno', ''),
-                'Total Horas': round(totals.get('total_hours_worked', 0.0), 2),
-                'Horas Regulares': round(totals.get('total_regular_hours', 0.0), 2),
-                'Horas Extra 50%': round(totals.get('total_extra_hours_50', 0.0), 2),
-                'Horas Extra 100%': round(totals.get('total_extra_hours_100', 0.0), 2),
-                'Horas Nocturnas': round(totals.get('total_night_hours', 0.0), 2),
-                'Horas Feriado': round(totals.get('total_holiday_hours', 0.0), 2),
-            })
+            ids.append(info.get('employeeInternalId', ''))
+            first_names.append(info.get('firstName', ''))
+            last_names.append(info.get('lastName', ''))
+            turnos.append(info.get('turno', ''))
+            for values, key in zip(hours, SUMMARY_TOTALS_KEYS):
+                values.append(totals.get(key, 0.0))
         
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame(columns)
+        hours_cols = list(SUMMARY_HOURS_COLUMNS)
+        df[hours_cols] = df[hours_cols].round(2)  # redondeo vectorizado de todas las horas
         
-        # Ordenar por turno: Mañana -> Tarde -> Noche -> Otros/Vacío
-        turno_order = {'Mañana': 1, 'Tarde': 2, 'Noche': 3}
-        df['turno_sort'] = df['Turno'].map(lambda x: turno_order.get(x, 999))
-        df = df.sort_values('turno_sort').drop('turno_sort', axis=1)
+        # Ordenar por turno: Mañana -> Tarde -> Noche -> Otros/Vacío (NaN del categórico, al final)
+        df = df.sort_values(
+            'Turno', kind='stable',
+            key=lambda turno: pd.Categorical(turno, categories=TURNO_ORDER, ordered=True),
+        )
         df = df.reset_index(drop=True)
         
         return df
 
-    def _create_daily_dataframe(self, processed_data: Dict) -> pd.DataFrame:
-        """Crea DataFrame del detalle diario."""
-        rows = []
+    def _iter_observations(self, is_holiday, holiday_name, has_time_off, time_off_name,
+                           has_absence, pending_hours, day_of_week) -> Iterator[str]:
+        """Genera las observaciones automáticas de un día."""
+        if is_holiday:
+            yield f"Feriado: {holiday_name or 'N/A'}"
+        if has_time_off:
+            yield f"Licencia: {time_off_name or 'N/A'}"
+        if has_absence:
+            yield "Ausencia"
+        if pending_hours > 0:
+            yield f"{pending_hours:.1f}h pendientes"
+        if day_of_week in WEEKEND_DAYS:
+            yield "Fin de semana"
+
+    def _iter_daily_rows(self, processed_data: Dict) -> Iterator[Tuple]:
+        """
+        Genera las filas del detalle diario (en el orden de DAILY_COLUMNS) sin materializarlas.
+        Las horas de daily_data ya vienen redondeadas a 2 decimales desde el calculador.
+        """
+        # Hay pocas combinaciones distintas de observaciones: se arma cada texto una sola vez
+        observations_cache = {}
         for emp in processed_data.values():
+            daily_data = emp['daily_data']
+            if not daily_data:
+                continue
+            # Datos del empleado: se leen una vez y se repiten en cada día
             info = emp['employee_info']
-            for d in emp['daily_data']:
-                observations = []
-                if d.get('is_holiday'):
-                    observations.append(f"Feriado: {d.get('holiday_name') or 'N/A'}")
-                if d.get('has_time_off'):
-                    observations.append(f"Licencia: {d.get('time_off_name') or 'N/A'}")
-                if d.get('has_absence'):
-                    observations.append("Ausencia")
-                if d.get('pending_hours', 0) > 0:
-                    observations.append(f"{d['pending_hours']:.1f}h pendientes")
-                if d.get('day_of_week') in ['Sábado', 'Domingo']:
-                    observations.append("Fin de semana")
-
-                rows.append({
-                    'ID Empleado': info.get('employeeInternalId', ''),
-                    'Nombre': info.get('firstName', ''),
-                    'Apellido': info.get('lastName', ''),
-                    'Fecha': d.get('date', ''),
-                    'Día': d.get('day_of_week', ''),
-                    'Turno': d.get('turno', ''),
-                    'Inicio Turno': d.get('shift_start', ''),
-                    'Fin Turno': d.get('shift_end', ''),
-                    'Es Franco': 'Sí' if d.get('is_rest_day') else 'No',
-                    'Horas Trabajadas': round(d.get('hours_worked', 0.0), 2),
-                    'Horas Regulares': round(d.get('regular_hours', 0.0), 2),
-                    'Horas Extra 50%': round(d.get('extra_hours_50', 0.0), 2),
-                    'Horas Extra 100%': round(d.get('extra_hours_100', 0.0), 2),
-                    'Horas Nocturnas': round(d.get('night_hours', 0.0), 2),
-                    'Horas Feriado': round(d.get('holiday_hours', 0.0), 2),
-                    'Horas Pendientes': round(d.get('pending_hours', 0.0), 2),
-                    'Es Feriado': 'Sí' if d.get('is_holiday') else 'No',
-                    'Nombre Feriado': d.get('holiday_name') or '',
-                    'Tiene Licencia': 'Sí' if d.get('has_time_off') else 'No',
-                    'Tipo Licencia': d.get('time_off_name') or '',
-                    'Tiene Ausencia': 'Sí' if d.get('has_absence') else 'No',
-                    'Observaciones': ', '.join(observations) if observations else '',
-                    'Cálculo (explicación)': d.get('calc_note', '')
-                })
-        return pd.DataFrame(rows)
-
-    # -------- Estilos --------
-
-    def _apply_styles(self, filepath: str, start_date: str, end_date: str, 
-                      df_summary: pd.DataFrame, df_daily: pd.DataFrame):
-        """Aplica estilos a las hojas del Excel."""
-        wb = load_workbook(filepath)
-        
-        self._style_summary_sheet(wb['Resumen Consolidado'], start_date, end_date, df_summary)
-        self._style_daily_sheet(wb['Detalle Diario'], start_date, end_date, df_daily)
-        
-        wb.save(filepath)
-
-    def _style_summary_sheet(self, ws, start_date: str, end_date: str, df: pd.DataFrame):
-        """Aplica estilos a la hoja de resumen."""
-        # Títulos
-        ws['A1'] = "REPORTE DE ASISTENCIA - RESUMEN CONSOLIDADO"
-        ws['A2'] = f"Período: {start_date} al {end_date}"
-        ws['A3'] = f"Generado: {datetime.now().strftime('%d/%m/%Y %H:%M')}"
-        for row in range(1, 4):
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-
-        # Headers (fila 5)
-        for col in range(1, len(df.columns) + 1):
-            cell = ws.cell(row=5, column=col)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.border = self.thin_border
-            cell.alignment = self.center_alignment
-
-        # Datos, colores y colores por turno
-        for row_idx in range(len(df)):
-            row = row_idx + 6
-            turno = df.iloc[row_idx]['Turno']
-            
-            # Determinar color de fondo por turno
-            turno_fill = None
-            if turno == 'Mañana':
-                turno_fill = self.turno_manana_fill
-            elif turno == 'Tarde':
-                turno_fill = self.turno_tarde_fill
-            elif turno == 'Noche':
-                turno_fill = self.turno_noche_fill
-            
-            for col in range(1, len(df.columns) + 1):
-                cell = ws.cell(row=row, column=col)
-                cell.border = self.thin_border
-                
-                # Aplicar solo color de turno a toda la fila
-                if turno_fill:
-                    cell.fill = turno_fill
-
-        # Totales
-        total_row = 6 + len(df) + 1
-        ws.cell(row=total_row, column=1, value="TOTALES").font = Font(bold=True)
-        for col in range(5, 11):  # Total Horas hasta Horas Feriado
-            col_letter = get_column_letter(col)
-            cell = ws.cell(row=total_row, column=col, value=f"=SUM({col_letter}6:{col_letter}{5 + len(df)})")
-            cell.font = Font(bold=True)
-            cell.border = self.thin_border
+            emp_id = info.get('employeeInternalId', '')
+            first_name = info.get('firstName', '')
+            last_name = info.get('lastName', '')
+            for d in daily_data:
+                # Campos usados más de una vez (columnas y observaciones)
+                is_holiday = d.get('is_holiday')
+                holiday_name = d.get('holiday_name') or ''
+                has_time_off = d.get('has_time_off')
+                time_off_name = d.get('time_off_name') or ''
+                has_absence = d.get('has_absence')
+                pending_hours = d.get('pending_hours', 0.0)
+                day_of_week = d.get('day_of_week', '')
 
-        # Anchos de columna
-        for col in range(1, len(df.columns) + 1):
-            ws.column_dimensions[get_column_letter(col)].width = 17
-
-    def _style_daily_sheet(self, ws, start_date: str, end_date: str, df: pd.DataFrame):
-        """Aplica estilos a la hoja de detalle diario."""
-        # Títulos
-        ws['A1'] = "DETALLE DIARIO DE ASISTENCIA"
-        ws['A2'] = f"Período: {start_date} al {end_date}"
-        ws['A3'] = f"Generado: {datetime.now().strftime('%d/%m/%Y %H:%M')}"
-        for row in range(1, 4):
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-
-        # Headers
+                obs_key = (is_holiday, holiday_name, has_time_off, time_off_name,
+                           has_absence, pending_hours, day_of_week)
+                observations = observations_cache.get(obs_key)
+                if observations is None:
+                    observations = observations_cache[obs_key] = ', '.join(self._iter_observations(*obs_key))
+
+                yield (
+                    emp_id,
+                    first_name,
+                    last_name,
+                    d.get('date', ''),
+                    day_of_week,
+                    d.get('turno', ''),
+                    d.get('shift_start', ''),
+                    d.get('shift_end', ''),
+                    SI if d.get('is_rest_day') else NO,
+                    d.get('hours_worked', 0.0),
+                    d.get('regular_hours', 0.0),
+                    d.get('extra_hours_50', 0.0),
+                    d.get('extra_hours_100', 0.0),
+                    d.get('night_hours', 0.0),
+                    d.get('holiday_hours', 0.0),
+                    pending_hours,
+                    SI if is_holiday else NO,
+                    holiday_name,
+                    SI if has_time_off else NO,
+                    time_off_name,
+                    SI if has_absence else NO,
+                    observations,
+                    d.get('calc_note', ''),
+                )
+
+    # -------- Hojas (write-only) --------
+
+    def _cell(self, ws, value, font=None, fill=None, border=None, alignment=None) -> WriteOnlyCell:
+        """Crea una celda write-only con los estilos indicados."""
+        cell = WriteOnlyCell(ws, value=value)
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        if border:
+            cell.border = border
+        if alignment:
+            cell.alignment = alignment
+        return cell
+
+    def _named_cell(self, ws, value, style: str) -> WriteOnlyCell:
+        """Crea una celda write-only con un estilo con nombre ya registrado."""
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+
+    def _write_title_rows(self, ws, title: str, start_date: str, end_date: str, generated_at: str):
+        """Escribe las filas 1-3 (títulos) y deja la fila 4 vacía."""
+        for text in (title,
+                     f"Período: {start_date} al {end_date}",
+                     f"Generado: {generated_at}"):
+            ws.append([self._cell(ws, text, font=self.title_font)])
+        ws.append([])
+
+    def _write_header_row(self, ws, headers):
+        """Escribe la fila de encabezados (fila 5) con el estilo con nombre HEADER_STYLE."""
+        row_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = HEADER_STYLE  # una sola asignación (font + fill + borde + alineación)
+            row_cells.append(cell)
+        ws.append(row_cells)
+
+    def _write_summary_sheet(self, ws, start_date: str, end_date: str, generated_at: str,
+                             df: pd.DataFrame):
+        """Escribe la hoja de resumen con sus estilos."""
+        # Anchos de columna (en write-only deben definirse antes de la primera fila)
         for col in range(1, len(df.columns) + 1):
-            cell = ws.cell(row=5, column=col)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.border = self.thin_border
-            cell.alignment = self.center_alignment
-
-        # Datos y colores
-        for row_idx in range(len(df)):
-            row = row_idx + 6
-            for col in range(1, len(df.columns) + 1):
-                cell = ws.cell(row=row, column=col)
-                cell.border = self.thin_border
-                
-                # Colores por métricas
-                if col == 11: cell.fill = self.regular_fill     # Horas Regulares
-                elif col == 12: cell.fill = self.extra_50_fill  # Extra 50
-                elif col == 13: cell.fill = self.extra_100_fill # Extra 100
-                elif col == 14: cell.fill = self.night_fill     # Nocturnas
-                elif col == 15: cell.fill = self.holiday_fill   # Horas Feriado
-                elif col == 16: cell.fill = self.pending_fill   # Pendientes
+            ws.column_dimensions[COL_LETTERS[col]].width = 17
+
+        # Títulos y headers (fila 5)
+        self._write_title_rows(ws, "REPORTE DE ASISTENCIA - RESUMEN CONSOLIDADO", start_date, end_date, generated_at)
+        self._write_header_row(ws, df.columns)
+
+        # Datos con color de fondo por turno (estilo con nombre para toda la fila)
+        turno_styles = {'Mañana': 'turno_manana', 'Tarde': 'turno_tarde', 'Noche': 'turno_noche'}
+        for values in df.itertuples(index=False, name=None):
+            style = turno_styles.get(values[3], 'data')  # Turno
+            ws.append([self._named_cell(ws, value, style) for value in values])
 
+        # Totales (dejando una fila en blanco): sumas ya calculadas, no fórmulas =SUM
+        ws.append([])
+        column_totals = df[list(SUMMARY_HOURS_COLUMNS)].sum()  # Total Horas hasta Horas Feriado
+        total_cells = [self._cell(ws, "TOTALES", font=self.bold_font), None, None, None]
+        for value in column_totals:
+            total_cells.append(self._cell(ws, round(float(value), 2),
+                                          font=self.bold_font, border=self.thin_border))
+        ws.append(total_cells)
+
+    def _write_daily_sheet(self, ws, start_date: str, end_date: str, generated_at: str,
+                           processed_data: Dict):
+        """Escribe la hoja de detalle diario con sus estilos."""
         # Anchos de columna
         col_widths = {22: 28, 23: 55, 18: 22}  # Observaciones, Explicación, Nombre Feriado
-        for col in range(1, len(df.columns) + 1):
+        for col in range(1, len(DAILY_COLUMNS) + 1):
             width = col_widths.get(col, 14)
-            ws.column_dimensions[get_column_letter(col)].width = width
+            ws.column_dimensions[COL_LETTERS[col]].width = width
+
+        # Títulos y headers
+        self._write_title_rows(ws, "DETALLE DIARIO DE ASISTENCIA", start_date, end_date, generated_at)
+        self._write_header_row(ws, DAILY_COLUMNS)
+
+        # Colores por métricas (con borde) y wrap text para observaciones y explicación.
+        # El resto de las columnas se escribe como valor plano, sin estilo por celda:
+        # las líneas de cuadrícula de Excel ya separan esas celdas.
+        col_styles = {
+            11: 'regular',    # Horas Regulares
+            12: 'extra_50',   # Extra 50
+            13: 'extra_100',  # Extra 100
+            14: 'night',      # Nocturnas
+            15: 'holiday',    # Horas Feriado
+            16: 'pending',    # Pendientes
+        }
+        wrap_cols = (22, 23)
+
+        # Tablas (índice en la fila, estilo) calculadas una sola vez para todas las filas
+        styled_idx = tuple((col - 1, style) for col, style in col_styles.items())
+        wrap_idx = tuple(col - 1 for col in wrap_cols)
 
-        # Wrap text para observaciones y explicación
-        for row in range(6, 6 + len(df)):
-            ws.cell(row=row, column=22).alignment = Alignment(wrap_text=True, vertical='top')
-            ws.cell(row=row, column=23).alignment = Alignment(wrap_text=True, vertical='top')
\ No newline at end of file
+        # Datos
+        for values in self._iter_daily_rows(processed_data):
+            row_cells = list(values)
+            for idx, style in styled_idx:
+                row_cells[idx] = self._named_cell(ws, values[idx], style)
+            for idx in wrap_idx:
+                row_cells[idx] = self._cell(ws, values[idx], alignment=self.wrap_alignment)
+            ws.append(row_cells)
@@ -2,15 +2,54 @@
 Calculador de Horas según Normativa Argentina
 """
 
+import warnings
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 from zoneinfo import ZoneInfo  # stdlib (Python >=3.9)
 from config.default_config import DEFAULT_CONFIG
 
+# Nombres de los días indexados por weekday() (0=Lun … 6=Dom)
+DAYS_ES = ('Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes', 'Sábado', 'Domingo')
+
+ONE_DAY = timedelta(days=1)
+
+# Fallbacks de solo lectura para campos opcionales del day_summary (evitan crear {} / [] por día)
+_EMPTY_DICT: Dict = {}
+_EMPTY_TUPLE: Tuple = ()
+
+# Feriados del config: se arman una sola vez y se comparten entre empleados
+DEFAULT_HOLIDAYS = frozenset(DEFAULT_CONFIG.get('holidays', []))
+
+
+def _fmt_date(dt: datetime) -> str:
+    """YYYY-MM-DD; igual a strftime("%Y-%m-%d") pero bastante más rápido."""
+    return dt.date().isoformat()
+
+
+def _fmt_hhmm(dt: datetime) -> str:
+    """HH:MM; igual a strftime("%H:%M") pero bastante más rápido."""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+class WeekdayDistribution(NamedTuple):
+    """Reparto de horas de un día según la regla Lun–Vie."""
+    regular: float
+    extra50: float
+    extra100: float
+    pending: float
+
 
 class ArgentineHoursCalculator:
     """Calculador de horas según normativa laboral argentina"""
 
+    # Atributos fijos (config leída en __init__): acceso por slot, sin __dict__ por instancia
+    __slots__ = (
+        'jornada_completa', 'hora_nocturna_inicio', 'hora_nocturna_fin', 'sabado_limite',
+        'tolerancia_minutos', 'fragmento_minutos', 'holiday_names', 'local_tz', 'extras_al_50',
+        '_jornada_horas', '_extras_al_50_horas',
+        '_night_window', '_saturday_100_window', '_sunday_window',
+    )
+
     def __init__(self):
         self.jornada_completa     = DEFAULT_CONFIG['jornada_completa_horas']
         self.hora_nocturna_inicio = DEFAULT_CONFIG['hora_nocturna_inicio']  # ej. 21
@@ -22,6 +61,13 @@ class ArgentineHoursCalculator:
         self.local_tz             = ZoneInfo(DEFAULT_CONFIG.get('local_timezone',
                                                                 'America/Argentina/Buenos_Aires'))
         self.extras_al_50         = DEFAULT_CONFIG.get("extras_al_50", 2)  # p.ej. 4 en ARM
+        # Versiones float precalculadas para los repartos por día
+        self._jornada_horas       = float(self.jornada_completa)
+        self._extras_al_50_horas  = float(self.extras_al_50)
+        # Ventanas fijas en segundos desde la medianoche del día de inicio del turno
+        self._night_window        = (self.hora_nocturna_inicio * 3600, (24 + self.hora_nocturna_fin) * 3600)
+        self._saturday_100_window = (self.sabado_limite * 3600, 24 * 3600)  # sábado desde las 13 hasta las 24
+        self._sunday_window       = (24 * 3600, 48 * 3600)                  # domingo siguiente al sábado
 
     # -------------------- Helpers de parsing / fechas --------------------
 
@@ -36,7 +82,8 @@ class ArgentineHoursCalculator:
         """
         if not s:
             return None
-        s = s.replace('Z', '+00:00')  # normalizo 'Z'
+        if s[-1] == 'Z':
+            s = s[:-1] + '+00:00'  # normalizo 'Z' (solo puede venir como sufijo)
         try:
             dt = datetime.fromisoformat(s)
             if dt.tzinfo is None:
@@ -51,113 +98,106 @@ class ArgentineHoursCalculator:
         devuelve (start_local, end_local). Maneja cruce de día si end <= start.
         """
         start_iso = end_iso = None
-        for e in (day_summary.get('entries') or []):
-            if e.get('type') == 'START' and not start_iso:
-                start_iso = e.get('time') or e.get('date')
-            elif e.get('type') == 'END' and not end_iso:
-                end_iso = e.get('time') or e.get('date')
+        for e in (day_summary.get('entries') or _EMPTY_TUPLE):
+            entry_type = e.get('type')
+            if entry_type == 'START':
+                if not start_iso:
+                    start_iso = e.get('time') or e.get('date')
+            elif entry_type == 'END':
+                if not end_iso:
+                    end_iso = e.get('time') or e.get('date')
+            if start_iso and end_iso:
+                break  # ya tengo el primer par; el resto de entries no cambia nada
 
         s_dt = self._parse_iso_to_local(start_iso[:25] if start_iso else None)
         e_dt = self._parse_iso_to_local(end_iso[:25] if end_iso else None)
         if s_dt and e_dt and e_dt <= s_dt:
-            e_dt += timedelta(days=1)  # cruza medianoche
+            e_dt += ONE_DAY  # cruza medianoche
         return s_dt, e_dt
 
-    def _display_from_entries(self, day_summary: Dict) -> Tuple[str, str, str, str]:
+    def _display_from_entries(self, ref_str: str, s_dt: Optional[datetime],
+                              e_dt: Optional[datetime], end_date_local: str) -> Tuple[str, str, str, str]:
         """
-        Devuelve (start_date, start_hhmm, end_date, end_hhmm) usando ENTRIES en local.
-        Si faltan, devuelve strings vacíos anclados al ref_str.
+        Devuelve (start_date, start_hhmm, end_date, end_hhmm) a partir del primer par
+        START/END de entries (ya en local). Si faltan, devuelve strings vacíos anclados al ref_str.
+        end_date_local es la fecha de e_dt ya formateada (YYYY-MM-DD).
         """
-        ref_str = self._get_ref_str(day_summary)
-        s_dt, e_dt = self._first_entry_pair_local(day_summary)
         if not (s_dt and e_dt):
             return ref_str, "", ref_str, ""
         return (
-            s_dt.strftime("%Y-%m-%d"),
-            s_dt.strftime("%H:%M"),
-            e_dt.strftime("%Y-%m-%d"),
-            e_dt.strftime("%H:%M"),
+            _fmt_date(s_dt),
+            _fmt_hhmm(s_dt),
+            end_date_local,
+            _fmt_hhmm(e_dt),
         )
 
-    def _get_intervals_from_entries(self, day_summary: Dict) -> List[Tuple[datetime, datetime]]:
-        """
-        Devuelve [(start_local, end_local)] usando entries.
-        (Si quisieras soportar varios pares START/END, expandí acá).
-        """
-        s_dt, e_dt = self._first_entry_pair_local(day_summary)
-        return [(s_dt, e_dt)] if (s_dt and e_dt) else []
-
-    def _get_holiday_name(self, date_str: str, day_summary: Dict) -> Optional[str]:
-        # 1) si viene desde la API
-        if day_summary.get('holidays'):
-            name = (day_summary['holidays'][0] or {}).get('name')
+    def _get_holiday_name(self, api_holidays: Optional[List[Dict]], out_date_str: str,
+                          ref_str: str) -> Optional[str]:
+        # 1) si viene desde la API (day_summary['holidays'])
+        if api_holidays:
+            name = (api_holidays[0] or {}).get('name')
             if name:
                 return name
-        # 2) si está en el config
-        return self.holiday_names.get(date_str)
+        # 2) si está en el config: primero la fecha imputada, después la de referencia
+        return self.holiday_names.get(out_date_str) or self.holiday_names.get(ref_str)
 
     # -------------------- Intersecciones / nocturnas --------------------
 
-    def _intersect_hours(self, a_start: datetime, a_end: datetime,
-                         b_start: datetime, b_end: datetime) -> float:
-        start = max(a_start, b_start)
-        end = min(a_end, b_end)
-        return max(0.0, (end - start).total_seconds() / 3600)
+    def _intersect_hours(self, a_start: float, a_end: float,
+                         b_start: float, b_end: float) -> float:
+        """Horas de solapamiento entre dos tramos expresados en segundos (misma referencia)."""
+        start = a_start if a_start > b_start else b_start
+        end = a_end if a_end < b_end else b_end
+        return (end - start) / 3600 if end > start else 0.0
 
-    def _compute_night_hours_from_intervals(self, intervals: List[Tuple[datetime, datetime]],
-                                            ref_dt: datetime) -> float:
+    def _compute_night_hours_from_intervals(self, intervals: List[Tuple[float, float]]) -> float:
         """
-        Ventana nocturna anclada al **día de inicio** (ref_dt): 21:00 → 06:00 del día siguiente.
+        Ventana nocturna anclada al **día de inicio**: 21:00 → 06:00 del día siguiente.
+        Los intervalos vienen en segundos desde la medianoche del día de inicio.
         """
-        n_start = ref_dt.replace(hour=self.hora_nocturna_inicio, minute=0, second=0, microsecond=0)
-        n_end   = (ref_dt + timedelta(days=1)).replace(hour=self.hora_nocturna_fin, minute=0, second=0, microsecond=0)
+        n_start, n_end = self._night_window
         total = 0.0
-        for s_dt, e_dt in intervals:
-            total += self._intersect_hours(s_dt, e_dt, n_start, n_end)
+        for s_sec, e_sec in intervals:
+            total += self._intersect_hours(s_sec, e_sec, n_start, n_end)
         return round(total, 2)
 
     # -------------------- Feriado por FIN local --------------------
 
-    def _crosses_into_holiday_local_end(self, day_summary: Dict,
+    def _crosses_into_holiday_local_end(self, end_date_local: str,
                                         ref_str: str,
                                         holiday_dates: Set[str]) -> Optional[str]:
         """
-        Si el END (en hora LOCAL) cae en un día distinto y ese día es feriado,
-        devuelve esa fecha (YYYY-MM-DD). Si no, None.
+        Si el END (fecha LOCAL, YYYY-MM-DD; vacía si no hay END) cae en un día distinto
+        y ese día es feriado, devuelve esa fecha. Si no, None.
         """
-        _, e_dt = self._first_entry_pair_local(day_summary)
-        if not e_dt:
-            return None
-        end_date_local = e_dt.strftime("%Y-%m-%d")
-        if end_date_local != ref_str and end_date_local in holiday_dates:
+        if end_date_local and end_date_local != ref_str and end_date_local in holiday_dates:
             return end_date_local
         return None
 
     # -------------------- Distribución auxiliar (Lun–Vie) --------------------
 
-    def _weekday_distribution(self, hours: float, has_time_off: bool) -> Dict:
+    def _weekday_distribution(self, hours: float, has_time_off: bool) -> WeekdayDistribution:
         """
         Reparte horas como Lun–Vie: regulares hasta jornada, luego extras 50% hasta
         'extras_al_50' y el resto 100%.
         """
         if hours <= 0:
-            return {'regular': 0.0, 'extra50': 0.0, 'extra100': 0.0, 'pending': 0.0}
+            return WeekdayDistribution(0.0, 0.0, 0.0, 0.0)
 
-        regular = min(hours, float(self.jornada_completa))
-        extra = max(0.0, hours - float(self.jornada_completa))
+        jornada = self._jornada_horas
+        if hours <= jornada:
+            # Caso más común: sin extras, solo regulares (+ pendientes si no hay licencia)
+            return WeekdayDistribution(hours, 0.0, 0.0, 0.0 if has_time_off else jornada - hours)
 
-        if extra <= self.extras_al_50:
-            e50 = extra
-            e100 = 0.0
-        else:
-            e50 = float(self.extras_al_50)
-            e100 = extra - float(self.extras_al_50)
+        extras_al_50 = self._extras_al_50_horas
+        regular = jornada
+        extra = hours - jornada
 
-        pending = 0.0
-        if not has_time_off and hours < self.jornada_completa:
-            pending = float(self.jornada_completa) - hours
+        # Extras: al 50% hasta el tope, el resto al 100%
+        e50 = min(extra, extras_al_50)
+        e100 = extra - e50
 
-        return {'regular': regular, 'extra50': e50, 'extra100': e100, 'pending': pending}
+        return WeekdayDistribution(regular, e50, e100, 0.0)
 
     # -------------------- Cálculo principal --------------------
 
@@ -165,7 +205,10 @@ class ArgentineHoursCalculator:
                               previous_pending_hours: float = 0,
                               holidays: Optional[Set[str]] = None) -> Dict:
 
-        holiday_dates = set(holidays) if holidays else set(DEFAULT_CONFIG.get('holidays', []))
+        if not holidays:
+            holiday_dates = DEFAULT_HOLIDAYS
+        else:
+            holiday_dates = holidays if isinstance(holidays, (set, frozenset)) else frozenset(holidays)
 
         turno = ''
 
@@ -174,16 +217,15 @@ class ArgentineHoursCalculator:
                 turno = seg['item']
                 employee_info["turno"] = turno
         daily_data: List[Dict] = []
-        totals = {
-            'total_days_worked': 0.0,
-            'total_hours_worked': 0.0,
-            'total_regular_hours': 0.0,
-            'total_extra_hours_50': 0.0,
-            'total_extra_hours_100': 0.0,
-            'total_night_hours': 0.0,
-            'total_holiday_hours': 0.0,          # NUEVO
-            'total_pending_hours': float(previous_pending_hours)
-        }
+        # Acumuladores locales (se vuelcan al dict de totales al final)
+        total_days_worked = 0.0
+        total_hours_worked = 0.0
+        total_regular_hours = 0.0
+        total_extra_hours_50 = 0.0
+        total_extra_hours_100 = 0.0
+        total_night_hours = 0.0
+        total_holiday_hours = 0.0
+        total_pending_hours = float(previous_pending_hours)
 
         for day_summary in day_summaries:
             
@@ -191,21 +233,28 @@ class ArgentineHoursCalculator:
             ref_str = self._get_ref_str(day_summary)
             if not ref_str:
                 continue
-            ref_dt = datetime.strptime(ref_str, '%Y-%m-%d')
+            ref_dt = datetime.fromisoformat(ref_str)  # YYYY-MM-DD, parser en C (más rápido que strptime)
             dow = ref_dt.weekday()  # 0=Lun … 6=Dom
 
-            hours_worked = float(day_summary.get('hours', {}).get('worked', 0)
+            hours_worked = float(day_summary.get('hours', _EMPTY_DICT).get('worked', 0)
                                  or day_summary.get('totalHours', 0) or 0)
-            is_holiday_api = bool(day_summary.get('holidays'))
-            has_time_off   = bool(day_summary.get('timeOffRequests'))
-            has_absence    = 'ABSENT' in (day_summary.get('incidences') or [])
+            api_holidays   = day_summary.get('holidays')
+            is_holiday_api = bool(api_holidays)
+            time_off_requests = day_summary.get('timeOffRequests')
+            has_time_off   = bool(time_off_requests)
+            has_absence    = 'ABSENT' in (day_summary.get('incidences') or _EMPTY_TUPLE)
             is_rest_day    = not bool(day_summary.get('isWorkday', True))  # FRANCO
 
             if hours_worked == 0 and not has_time_off:
                 continue
 
+            # Primer par START/END de entries en local: se parsea una sola vez por día
+            # y se reusa para el feriado por fin, los intervalos y la nota
+            s_dt, e_dt = self._first_entry_pair_local(day_summary)
+            end_date_local = _fmt_date(e_dt) if e_dt else ""  # se formatea una sola vez
+
             # Feriado por fin local
-            end_holiday_str    = self._crosses_into_holiday_local_end(day_summary, ref_str, holiday_dates)
+            end_holiday_str    = self._crosses_into_holiday_local_end(end_date_local, ref_str, holiday_dates)
             is_ref_holiday_cfg = ref_str in holiday_dates
             is_out_holiday_cfg = bool(end_holiday_str)
 
@@ -216,12 +265,15 @@ class ArgentineHoursCalculator:
             is_holiday_output = is_holiday_api or is_ref_holiday_cfg or is_out_holiday_cfg
             holiday_name = None
             if is_holiday_output:
-                holiday_name = self._get_holiday_name(out_date_str, day_summary) or \
-                               self._get_holiday_name(ref_str, day_summary)
+                holiday_name = self._get_holiday_name(api_holidays, out_date_str, ref_str)
 
             # Intervalos (from ENTRIES en local) y nocturnas
-            intervals = self._get_intervals_from_entries(day_summary)
-            night_hours = self._compute_night_hours_from_intervals(intervals, ref_dt) \
+            # (Si quisieras soportar varios pares START/END, expandí acá).
+            # Se pasan a segundos desde la medianoche de ref_dt (una resta por extremo) para
+            # intersectar con las ventanas fijas sumando/comparando floats.
+            intervals = [((s_dt - ref_dt).total_seconds(), (e_dt - ref_dt).total_seconds())] \
+                        if (s_dt and e_dt) else []
+            night_hours = self._compute_night_hours_from_intervals(intervals) \
                           if intervals else 0.0
 
             # Horas “feriado” (solo si es feriado, no domingo)
@@ -255,20 +307,16 @@ class ArgentineHoursCalculator:
                 #   - Porción en domingo (si el turno cruza) ⇒ 100%
                 #   - El resto (antes de 13) ⇒ distribución Lun–Vie
                 if intervals:
-                    sat_13 = ref_dt.replace(hour=self.sabado_limite, minute=0, second=0, microsecond=0)
-                    sat_24 = (ref_dt + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+                    sat_13, sat_24 = self._saturday_100_window
                     sat100 = 0.0
-                    for s_dt, e_dt in intervals:
-                        sat100 += self._intersect_hours(s_dt, e_dt, sat_13, sat_24)
+                    for s_sec, e_sec in intervals:
+                        sat100 += self._intersect_hours(s_sec, e_sec, sat_13, sat_24)
 
-                    # Si el día siguiente es domingo, también es 100% (cualquier tramo en ese domingo)
-                    next_day = ref_dt + timedelta(days=1)
+                    # El día siguiente a un sábado es domingo: también es 100% (cualquier tramo en ese domingo)
+                    sun_start, sun_end = self._sunday_window
                     sun100 = 0.0
-                    if next_day.weekday() == 6:  # domingo
-                        sun_start = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-                        sun_end   = (next_day + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-                        for s_dt, e_dt in intervals:
-                            sun100 += self._intersect_hours(s_dt, e_dt, sun_start, sun_end)
+                    for s_sec, e_sec in intervals:
+                        sun100 += self._intersect_hours(s_sec, e_sec, sun_start, sun_end)
                     weekend_100 = round(sat100 + sun100, 2)
                 else:
                     # Sin intervals (entries) no podemos cortar por 13:00 ⇒
@@ -276,33 +324,26 @@ class ArgentineHoursCalculator:
                     weekend_100 = 0.0
 
                 base_hours = max(0.0, hours_worked - weekend_100)
-                dist = self._weekday_distribution(base_hours, has_time_off)
-                regular_hours = dist['regular']
-                extra50 = dist['extra50']
-                extra100 = dist['extra100'] + weekend_100
-                pending = dist['pending']
+                regular_hours, extra50, extra100, pending = self._weekday_distribution(base_hours, has_time_off)
+                extra100 += weekend_100
 
             else:
                 # Lun–Vie normal
-                dist = self._weekday_distribution(hours_worked, has_time_off)
-                regular_hours = dist['regular']
-                extra50 = dist['extra50']
-                extra100 = dist['extra100']
-                pending = dist['pending']
+                regular_hours, extra50, extra100, pending = self._weekday_distribution(hours_worked, has_time_off)
 
             # ---------------- Acumulo totales ----------------
-            totals['total_days_worked']     += 1
-            totals['total_hours_worked']    += hours_worked
-            totals['total_regular_hours']   += regular_hours
-            totals['total_extra_hours_50']  += extra50
-            totals['total_extra_hours_100'] += extra100
-            totals['total_night_hours']     += night_hours
-            totals['total_holiday_hours']   += holiday_hours
+            total_days_worked     += 1
+            total_hours_worked    += hours_worked
+            total_regular_hours   += regular_hours
+            total_extra_hours_50  += extra50
+            total_extra_hours_100 += extra100
+            total_night_hours     += night_hours
+            total_holiday_hours   += holiday_hours
             if not has_time_off and not has_absence:
-                totals['total_pending_hours'] += pending
+                total_pending_hours += pending
 
             # ---- Nota (horarios locales) ----
-            disp_start_d, disp_start_h, disp_end_d, disp_end_h = self._display_from_entries(day_summary)
+            disp_start_d, disp_start_h, disp_end_d, disp_end_h = self._display_from_entries(ref_str, s_dt, e_dt, end_date_local)
             exp_parts = []
             if disp_start_h or disp_end_h:
                 exp_parts.append(f"Inicio {disp_start_d} {disp_start_h} → Fin {disp_end_d} {disp_end_h}.")
@@ -338,31 +379,35 @@ class ArgentineHoursCalculator:
                         exp_parts.append("Lun–Vie: horas dentro de la jornada regular.")
                 else:
                     extra = hours_worked - self.jornada_completa
-                    e50_view = min(extra, float(self.extras_al_50))
-                    e100_view = max(0.0, extra - float(self.extras_al_50))
+                    e50_view = min(extra, self._extras_al_50_horas)
+                    e100_view = max(0.0, extra - self._extras_al_50_horas)
                     exp_parts.append(
                         f"Lun–Vie: 8h regulares + {e50_view:.2f}h 50% + {e100_view:.2f}h 100%."
                     )
 
             calc_note = " ".join(exp_parts)
 
-            # Fila diaria
+            # Día de la semana de la fecha imputada (solo se parsea si difiere de ref_str)
+            out_dow = dow if out_date_str == ref_str else datetime.fromisoformat(out_date_str).weekday()
+
+            # Fila diaria (horas redondeadas a 2 decimales para mostrar)
+            hours_worked_2d = round(hours_worked, 2)
             daily_data.append({
                 'employee_id': employee_info.get('employeeInternalId'),
                 'date': out_date_str,
-                'day_of_week': self.get_day_of_week_spanish(datetime.strptime(out_date_str, '%Y-%m-%d')),
-                'hours_worked': round(hours_worked, 2),
+                'day_of_week': DAYS_ES[out_dow],
+                'hours_worked': hours_worked_2d,
                 'regular_hours': round(regular_hours, 2),
                 'extra_hours_50': round(extra50, 2),
                 'extra_hours_100': round(extra100, 2),
-                'night_hours': round(night_hours, 2),
-                'holiday_hours': round(holiday_hours, 2),               # NUEVO
+                'night_hours': night_hours,                              # ya redondeadas a 2 decimales
+                'holiday_hours': hours_worked_2d if is_holiday_output else 0.0,  # NUEVO
                 'pending_hours': round(pending, 2) if not (has_time_off or has_absence) else 0.0,
                 'is_holiday': is_holiday_output,
                 'holiday_name': holiday_name,
                 'is_rest_day': bool(is_rest_day),                        # NUEVO
                 'has_time_off': has_time_off,
-                'time_off_name': (day_summary.get('timeOffRequests') or [{}])[0].get('name') if has_time_off else None,
+                'time_off_name': time_off_requests[0].get('name') if has_time_off else None,
                 'has_absence': has_absence,
                 'is_full_time': hours_worked >= self.jornada_completa,
                 'shift_start': " ".join([disp_start_d, disp_start_h]).strip(),  # NUEVO
@@ -371,6 +416,17 @@ class ArgentineHoursCalculator:
                 'calc_note': calc_note,
             })
 
+        totals = {
+            'total_days_worked': total_days_worked,
+            'total_hours_worked': total_hours_worked,
+            'total_regular_hours': total_regular_hours,
+            'total_extra_hours_50': total_extra_hours_50,
+            'total_extra_hours_100': total_extra_hours_100,
+            'total_night_hours': total_night_hours,
+            'total_holiday_hours': total_holiday_hours,          # NUEVO
+            'total_pending_hours': total_pending_hours
+        }
+
         # compensaciones (si las usás)
         compensations = self.calculate_compensations(
             totals['total_extra_hours_50'],
@@ -393,7 +449,14 @@ class ArgentineHoursCalculator:
         """
         Mantengo por compatibilidad, pero la rama de sábado ahora se maneja en process_employee_data
         con cortes por intervalo. Para Lun–Vie usa extras_al_50 de config.
+
+        Obsoleto: no se usa en el cálculo del reporte; usar process_employee_data.
         """
+        warnings.warn(
+            "calculate_hour_distribution está obsoleto; usar process_employee_data",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         if hours_worked == 0:
             return {
                 'hours_worked': 0.0,
@@ -419,11 +482,11 @@ class ArgentineHoursCalculator:
         dist = self._weekday_distribution(float(hours_worked), has_time_off)
         return {
             'hours_worked': float(hours_worked),
-            'regular_hours': float(dist['regular']),
-            'extra_hours_50': float(dist['extra50']),
-            'extra_hours_100': float(dist['extra100']),
+            'regular_hours': float(dist.regular),
+            'extra_hours_50': float(dist.extra50),
+            'extra_hours_100': float(dist.extra100),
             'night_hours': float(night_hours),
-            'pending_hours': float(dist['pending'])
+            'pending_hours': float(dist.pending)
         }
 
     # -------------------- Otras utilidades --------------------
@@ -454,8 +517,7 @@ class ArgentineHoursCalculator:
         }
 
     def get_day_of_week_spanish(self, date: datetime) -> str:
-        days = ['Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes', 'Sábado', 'Domingo']
-        return days[date.weekday()]
+        return DAYS_ES[date.weekday()]
 
     def is_night_hour(self, hour: int) -> bool:
         return hour >= self.hora_nocturna_inicio or hour < self.hora_nocturna_fin
@@ -470,21 +532,33 @@ class ArgentineHoursCalculator:
         return f"{h:02d}:{m:02d}"
 
     def minutes_to_hours(self, minutes: int) -> float:
-        return round(minutes / 60, 2)
+        # Centésimas de hora redondeadas en enteros: igual a round(minutes / 60, 2) para minutos enteros
+        return ((minutes * 100 + 30) // 60) / 100
 
     def round_to_fragment(self, minutes: int) -> int:
-        import math
-        return math.ceil(minutes / self.fragmento_minutos) * self.fragmento_minutos
+        fragmento = self.fragmento_minutos
+        return -(-minutes // fragmento) * fragmento  # división entera redondeando hacia arriba
 
 
 # Funciones de compatibilidad
+_default_calculator: Optional[ArgentineHoursCalculator] = None
+
+
+def _get_default_calculator() -> ArgentineHoursCalculator:
+    """Instancia compartida por las funciones de compatibilidad (el calculador no guarda estado por empleado)."""
+    global _default_calculator
+    if _default_calculator is None:
+        _default_calculator = ArgentineHoursCalculator()
+    return _default_calculator
+
+
 def process_employee_data_from_day_summaries(day_summaries: List[Dict], employee_info: Dict,
                                              previous_pending_hours: float = 0,
                                              period_dates: Dict = None, holidays: Optional[Set[str]] = None) -> Dict:
-    calc = ArgentineHoursCalculator()
+    calc = _get_default_calculator()
     return calc.process_employee_data(day_summaries, employee_info, previous_pending_hours, holidays or set())
 
 
 def calculate_compensations(extra_hours_50: float, extra_hours_100: float, pending_hours: float) -> Dict:
-    calc = ArgentineHoursCalculator()
+    calc = _get_default_calculator()
     return calc.calculate_compensations(extra_hours_50, extra_hours_100, pending_hours)